@@ -47,7 +47,7 @@ def restrictions(engine, req):
 
     with engine.connect() as conn:
         cursor = conn.execute(text(sql), email) if email else conn.execute(text(sql))
-        return [orjson.loads(r[0].encode('utf-8')) for r in cursor]
+        return [orjson.loads(r[0]) for r in cursor]
 
 
 def restricted_keywords(engine, req):
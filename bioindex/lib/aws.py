@@ -1,4 +1,5 @@
 import base64
+import functools
 import time
 
 import boto3
@@ -18,11 +19,11 @@ lambda_client = boto3.client('lambda', config=aws_config)
 s3_client = boto3.client('s3', config=aws_config)
 rds_client = boto3.client('rds', config=aws_config)
 secrets_client = boto3.client('secretsmanager', config=aws_config)
-dynamo_client = boto3.resource('dynamodb', region_name='us-east-1')
+batch_client = boto3.client('batch', config=aws_config)
+dynamo_client = boto3.resource('dynamodb', config=aws_config)
 
 
 def get_bgzip_job_status(job_id: str):
-    batch_client = boto3.client('batch')
     job_response = batch_client.describe_jobs(jobs=[job_id])
     if len(job_response['jobs']) > 0:
         return job_response['jobs'][0]['status']
@@ -30,7 +31,6 @@ def get_bgzip_job_status(job_id: str):
 
 
 def start_batch_job(index_name: str, s3_path: str, job_definition: str, additional_parameters: dict = None):
-    batch_client = boto3.client('batch')
     parameters = {'index': index_name, 'path': s3_path, 'bucket': 'dig-bio-index'}
     if additional_parameters:
         # boto requires this
@@ -47,7 +47,6 @@ def start_batch_job(index_name: str, s3_path: str, job_definition: str, addition
 
 def start_and_wait_for_indexer_job(file: str, index: str, arity: int, bucket: str, rds_secret: str, rds_schema: str,
                                    size: int):
-    batch_client = boto3.client('batch')
     response = batch_client.submit_job(
         jobName='batch-indexer-job',
         jobQueue='indexer-job-queue',
@@ -66,9 +65,11 @@ def start_and_wait_for_indexer_job(file: str, index: str, arity: int, bucket: st
         time.sleep(60)
 
 
-def secret_lookup(secret_id):
+@functools.lru_cache(maxsize=128)
+def _get_secret_string(secret_id):
     """
-    Return the contents of a secret.
+    Fetch the raw contents of a secret. Cached, since the same secrets are
+    looked up repeatedly and each lookup is a network round-trip.
     """
     response = secrets_client.get_secret_value(SecretId=secret_id)
     secret = response.get('SecretString')
@@ -77,14 +78,22 @@ def secret_lookup(secret_id):
     if not secret:
         secret = base64.b64decode(response['SecretBinary'])
 
-    # parse it as json
-    return orjson.loads(secret)
+    return secret
 
 
+def secret_lookup(secret_id):
+    """
+    Return the contents of a secret.
+    """
+    return orjson.loads(_get_secret_string(secret_id))
+
+
+@functools.lru_cache(maxsize=32)
 def describe_rds_instance(instance_name):
     """
     Returns a dictionary with the engine, host, and port information
-    for the requested RDS instance.
+    for the requested RDS instance. The instance endpoint doesn't change
+    while running, so results are cached (use cache_clear to reset).
     """
     response = rds_client.describe_db_instances(DBInstanceIdentifier=instance_name)
     instances = response['DBInstances']
@@ -113,8 +122,23 @@ def connect_to_db(schema=None, **kwargs):
     # build the connection uri
     uri = '{engine}+pymysql://{username}:{password}@{host}/{schema}?local_infile=1'.format(schema=schema, **kwargs)
 
-    # create the connection pool
-    engine = sqlalchemy.create_engine(uri, pool_recycle=3600)
+    # share the connection pool with anything else using the same database
+    return _create_engine(uri)
+
+
+@functools.lru_cache(maxsize=8)
+def _create_engine(uri):
+    """
+    Create a connection pool for a database uri. Connections are checked
+    before use so stale ones are replaced instead of failing a query.
+    """
+    engine = sqlalchemy.create_engine(
+        uri,
+        pool_size=20,
+        max_overflow=40,
+        pool_pre_ping=True,
+        pool_recycle=3600,
+    )
 
     # test the engine by making a single connection
     with engine.connect():
@@ -125,7 +149,7 @@ def invoke_lambda(function_name, payload):
     """
     Invokes an AWS lambda function and waits for it to complete.
     """
-    payload = orjson.dumps(payload).decode('utf-8')
+    payload = orjson.dumps(payload)
 
     # invoke and wait for response
     response = lambda_client.invoke(
@@ -145,8 +169,16 @@ def invoke_lambda(function_name, payload):
     return payload['body']
 
 
+@functools.lru_cache(maxsize=8)
+def _dynamo_table(name):
+    """
+    Returns the DynamoDB table resource for a table name.
+    """
+    return dynamo_client.Table(name)
+
+
 def look_up_var_id(rs_id: str, dynamo_table) -> dict:
-    table = dynamo_client.Table(dynamo_table)
+    table = _dynamo_table(dynamo_table)
     response = table.query(
         KeyConditionExpression=boto3.dynamodb.conditions.Key('rsid').eq(rs_id)
     )
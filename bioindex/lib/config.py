@@ -12,18 +12,31 @@ from .utils import read_gff
 def config_var(type=str, default=None):
     """
     Wrap a property that returns a string so that it reads from
-    various places where that value may be set.
+    various places where that value may be set. The resolved value is
+    cached on the instance, since the environment doesn't change once
+    the configuration has been loaded.
     """
     def decorator(f):
-        def wrapper(*args):
-            key = f(*args)
-            val = os.environ.get(key, default)
+        @functools.wraps(f)
+        def wrapper(self):
+            cache = self.__dict__.setdefault('_cache', {})
+
+            # already resolved?
+            if f.__name__ in cache:
+                return cache[f.__name__]
+
+            key = f(self)
+            val = os.environ.get(key)
 
             # cast to the appropriate type
             if type == list:
-                return val.split(',') if val else []
+                val = val.split(',') if val else []
             else:
-                return val and type(val)
+                val = val or default
+                val = type(val) if val is not None else None
+
+            cache[f.__name__] = val
+            return val
 
         return wrapper
     return decorator
@@ -49,6 +62,9 @@ class Config:
             # use keyword arguments if environment not yet set
             Config.set_default_env(kwargs)
 
+            # the environment may have changed; resolve values again
+            self.invalidate_cache()
+
             # validate required settings
             assert self.s3_bucket, 'BIOINDEX_S3_BUCKET not set in the environment'
             assert self.rds_config, 'BIOINDEX_RDS_SECRET nor BIOINDEX_RDS_INSTANCE set in the environment'
@@ -57,14 +73,21 @@ class Config:
             logging.error(ex)
             sys.exit(-1)
 
+    def invalidate_cache(self):
+        """
+        Forget all cached environment values so they are read again.
+        """
+        self.__dict__.pop('_cache', None)
+
     @staticmethod
     def set_default_env(env):
         """
-        Set environment variables, but only if not already set.
+        Set environment variables, but only if not already set. Values
+        are converted to strings, as secrets may contain numbers, etc.
         """
         for k, v in env.items():
-            if not os.getenv(k):
-                os.environ[k] = v
+            if not os.getenv(k) and v is not None:
+                os.environ[k] = str(v)
 
     @functools.cached_property
     def rds_config(self):
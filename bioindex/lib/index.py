@@ -77,14 +77,12 @@ class Index:
             """
             sql = 'SELECT `name`, `table`, `prefix`, `schema`, `built`, `compressed` FROM `__Indexes`'
 
-            # convert all rows to an index definition
-            indexes = map(lambda r: Index(*r), conn.execute(text(sql)).fetchall())
-
             # remove indexes not built?
             if filter_built:
-                indexes = filter(lambda i: i.built, indexes)
+                sql += ' WHERE `built` IS NOT NULL'
 
-            return indexes
+            # convert all rows to an index definition
+            return map(lambda r: Index(*r), conn.execute(text(sql)).fetchall())
 
     @staticmethod
     def lookup(engine, name, arity):
@@ -145,8 +143,11 @@ class Index:
         Builds the index table for objects in S3.
         """
         logging.info('Finding keys in %s...', self.s3_prefix)
-        json_objects = list(list_objects(config.s3_bucket, self.s3_prefix, only='*.json'))
-        gz_objects = list(list_objects(config.s3_bucket, self.s3_prefix, only='*.json.gz'))
+        all_objects = list(list_objects(config.s3_bucket, self.s3_prefix))
+
+        # split the listing into uncompressed and compressed objects
+        json_objects = [o for o in all_objects if o['Key'].endswith('.json')]
+        gz_objects = [o for o in all_objects if o['Key'].endswith('.json.gz')]
         if len(json_objects) > 0 and len(gz_objects) > 0:
             raise ValueError(f'There are both compressed and uncompressed files in {self.s3_prefix}. '
                              f'An index needs to be all one or the other.')
@@ -229,29 +230,39 @@ class Index:
         """
         logging.info('Finding stale keys...')
         db_keys = self.lookup_keys(engine)
-        # if a file in s3 is in the db but the version is different from what's in s3 we delete
-        updated_files_for_db = [{'id': db_keys[o['Key']]['id'], 'key': o['Key']} for o in objects
-                                if o['Key'] in db_keys and db_keys[o['Key']]['version'] != o['ETag'].strip('"')[:32]]
-        updated_files_for_return = [o for o in objects if o['Key'] in set([f['key'] for f in updated_files_for_db])]
-        s3_keys = set([o['Key'] for o in objects])
-        deleted_files = [{'id': db_keys[k]['id'], 'key': k} for k in db_keys if k not in s3_keys]
-        new_files = [o for o in objects if o['Key'] not in db_keys]
+        s3_keys = set()
+        new_files = []
+        updated_files_for_return = []
+        stale_ids = []
+
+        for o in objects:
+            db_key = db_keys.get(o['Key'])
+            s3_keys.add(o['Key'])
+
+            # if a file in s3 is in the db but the version is different from what's in s3 we delete
+            if db_key is None:
+                new_files.append(o)
+            elif db_key['version'] != o['ETag'].strip('"')[:32]:
+                updated_files_for_return.append(o)
+                stale_ids.append(db_key['id'])
+
         # if a file is in the db but not in s3 we delete
-        updated_or_deleted_files = updated_files_for_db + deleted_files
+        stale_ids += [db_key['id'] for k, db_key in db_keys.items() if k not in s3_keys]
 
-        if updated_or_deleted_files:
+        if stale_ids:
             with rich.progress.Progress(console=console) as progress:
-                task = progress.add_task('[red]Deleting...[/]', total=len(updated_or_deleted_files))
+                task = progress.add_task('[red]Deleting...[/]', total=len(stale_ids))
                 n = 0
 
                 # delete stale or missing keys
-                for kid in updated_or_deleted_files:
+                for key_id in stale_ids:
                     sql = f'DELETE FROM `{self.table.name}` WHERE `key` = :key'
                     with engine.begin() as conn:
-                        n += conn.execute(text(sql), {'key': kid['id']}).rowcount
+                        n += conn.execute(text(sql), {'key': key_id}).rowcount
+
+                        # remove the key from the __Keys table in the same transaction
+                        conn.execute(text('DELETE FROM `__Keys` WHERE `id` = :id'), {'id': key_id})
 
-                    # remove the key from the __Keys table
-                    self.delete_key(engine, kid['key'])
                     progress.advance(task)
 
                 # show what was done
@@ -357,18 +368,19 @@ class Index:
         # process each line (record)
         for line_num, line in enumerate(content):
             row = orjson.loads(line)
-            end_offset = start_offset + len(line.encode('utf-8')) + 1  # newline
+
+            # only non-ascii lines need encoding to get their size in bytes
+            line_size = len(line) if line.isascii() else len(line.encode('utf-8'))
+            end_offset = start_offset + line_size + 1  # newline
 
             try:
                 for key_tuple in self.schema.index_builder(row):
-                    if key_tuple in records:
-                        records[key_tuple]['end_offset'] = end_offset
+                    offsets = records.get(key_tuple)
+
+                    if offsets is None:
+                        records[key_tuple] = [start_offset, end_offset]
                     else:
-                        records[key_tuple] = {
-                            'key': key_id,
-                            'start_offset': start_offset,
-                            'end_offset': end_offset,
-                        }
+                        offsets[1] = end_offset
             except (KeyError, ValueError) as e:
                 logging.warning('%s; skipping...', e)
 
@@ -387,7 +399,13 @@ class Index:
         # NOTE: Because this is called as a job, be sure and return a iterator
         #       and not the records as this is memory that is kept around for
         #       the entire duration of indexing.
-        return key, ({**self.schema.column_values(k), **r} for k, r in records.items())
+        #
+        #       Offsets are tracked as [start, end] pairs and each row is only
+        #       built once, as it's handed off to be inserted.
+        return key, (
+            {**self.schema.column_values(k), 'key': key_id, 'start_offset': start, 'end_offset': end}
+            for k, (start, end) in records.items()
+        )
 
     def insert_records(self, engine, records):
         """
@@ -461,10 +479,26 @@ class Index:
         already exists and the versions match, just return the ID for it.
         If the versions don't match, delete the existing record and create
         a new one with a new ID.
+
+        Stale keys are removed before indexing, so the insert is attempted
+        first and the existing key is only looked up if it's a duplicate.
         """
-        sql = 'SELECT `id`, `version` FROM `__Keys` WHERE `index` = :index and `key` = :key'
+        params = {'index': self.name, 'key': key, 'version': version}
+        sql = 'INSERT INTO `__Keys` (`index`, `key`, `version`) VALUES (:index, :key, :version)'
+
         with engine.connect() as conn:
-            row = conn.execute(text(sql), {'index': self.name, 'key': key}).fetchone()
+            try:
+                row = conn.execute(text(sql), params)
+                conn.commit()
+                return row.lastrowid
+            except sqlalchemy.exc.IntegrityError:
+                conn.rollback()
+
+            # the key already exists
+            row = conn.execute(
+                text('SELECT `id`, `version` FROM `__Keys` WHERE `index` = :index and `key` = :key'),
+                params,
+            ).fetchone()
 
             if row is not None:
                 if row[1] == version:
@@ -474,20 +508,10 @@ class Index:
                 conn.execute(text('DELETE FROM `__Keys` WHERE `id` = :id'), {'id': row[0]})
 
             # add a new entry
-            sql = 'INSERT INTO `__Keys` (`index`, `key`, `version`) VALUES (:index, :key, :version)'
-            row = conn.execute(text(sql), {'index': self.name, 'key': key, 'version': version})
+            row = conn.execute(text(sql), params)
             conn.commit()
             return row.lastrowid
 
-    def delete_key(self, engine, key):
-        """
-        Removes all records from the index and the key from the __Keys
-        table for a paritcular index/key pair.
-        """
-        sql = 'DELETE FROM `__Keys` WHERE `index` = :index and `key` = :key'
-        with engine.begin() as conn:
-            conn.execute(text(sql), {'index': self.name, 'key': key})
-
     def delete_keys(self, engine):
         """
         Removes all records from the __Keys table for a paritcular index
@@ -118,7 +118,7 @@ def match(config, engine, index, q):
 
     # build the SQL statement
     sql = (
-        f'SELECT `{distinct_column}` FROM `{index.table}` '
+        f'SELECT DISTINCT `{distinct_column}` FROM `{index.table}` '
         f'USE INDEX (`schema_idx`) '
     )
 
@@ -128,7 +128,6 @@ def match(config, engine, index, q):
 
     # create the match pattern
     pattern = '%' if q[-1] in ['_', '*'] else re.sub(r'_|%|$', lambda m: f'%{m.group(0)}', q[-1])
-    prev_key = None
 
     # fetch all the results
     with engine.connect() as conn:
@@ -138,11 +137,7 @@ def match(config, engine, index, q):
 
         # yield all the results until no more matches
         for r in cursor:
-            if r[0] != prev_key:
-                yield r[0]
-
-            # don't return this key again
-            prev_key = r[0]
+            yield r[0]
 
 
 def _run_query(config, engine, index, q, restricted):
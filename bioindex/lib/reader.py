@@ -1,17 +1,29 @@
 import subprocess
 
 import botocore.exceptions
+import concurrent.futures
 import dataclasses
 import itertools
 import logging
 import orjson
 
 from .auth import verify_record
-from .s3 import read_lined_object
+from .s3 import read_lines, read_object
 # from . import config
 
 # CONFIG = config.Config()
 
+# shared executor used to request the next source while reading the current
+_prefetch_executor = concurrent.futures.ThreadPoolExecutor(max_workers=20)
+
+
+def _close_prefetched(future):
+    """
+    Close the body of a prefetched S3 object that will never be read.
+    """
+    if not future.cancelled() and future.exception() is None and future.result() is not None:
+        future.result().close()
+
 
 @dataclasses.dataclass(frozen=True)
 class RecordSource:
@@ -66,6 +78,10 @@ class RecordReader:
         for source in sources:
             self.bytes_total += source.length
 
+        # open S3 object being read and the (source, future) being prefetched
+        self._body = None
+        self._prefetch = None
+
         # start reading the records on-demand
         self.record_filter = record_filter
         self.records = self._readall()
@@ -75,10 +91,20 @@ class RecordReader:
             self.records = filter(record_filter, self.records)
 
     def _readall(self):
+        """
+        A generator that reads each of the records from S3 for the sources.
+        Any open S3 objects are released if the reader is abandoned early.
+        """
+        try:
+            yield from self._read_sources()
+        finally:
+            self._close_sources()
+
+    def _read_sources(self):
         """
         A generator that reads each of the records from S3 for the sources.
         """
-        for source in self.sources:
+        for n, source in enumerate(self.sources):
 
             # This is here to handle a particularly bad condition: when the
             # byte offsets are mucked up and this would cause the reader to
@@ -116,13 +142,23 @@ class RecordReader:
                             raise subprocess.CalledProcessError(proc.returncode, command, output=stderr)
 
                 else:
-                    content = read_lined_object(self.config.s3_bucket, source.key, offset=source.start,
-                                          length=source.end - source.start)
+                    self._close_body()
+
+                    # use the prefetched object unless it never got started
+                    if self._prefetch and self._prefetch[0] is source and not self._prefetch[1].cancel():
+                        self._body = self._prefetch[1].result()
+                    else:
+                        self._body = self._open_source(source)
+
+                    # request the next source while this one is read, unless limited
+                    self._prefetch = self._prefetch_source(n + 1) if self.limit is None else None
 
                     # handle a bad case where the content failed to be read
-                    if content is None:
+                    if self._body is None:
                         raise FileNotFoundError(source.key)
 
+                    content = read_lines(self._body, source.key)
+
                     for line in content:
                         self.bytes_read += len(line) + 1  # eol character
 
@@ -145,6 +181,41 @@ class RecordReader:
             except FileNotFoundError:
                 logging.error('Failed to read key %s; some records missing', source.key)
 
+    def _close_body(self):
+        """
+        Close the S3 object currently being read.
+        """
+        if self._body is not None:
+            self._body.close()
+            self._body = None
+
+    def _close_sources(self):
+        """
+        Close the S3 object being read and any prefetched object.
+        """
+        self._close_body()
+
+        if self._prefetch and not self._prefetch[1].cancel():
+            self._prefetch[1].add_done_callback(_close_prefetched)
+
+        self._prefetch = None
+
+    def _open_source(self, source):
+        """
+        Open the portion of the S3 object for a source and return its body.
+        """
+        return read_object(self.config.s3_bucket, source.key, offset=source.start, length=source.length)
+
+    def _prefetch_source(self, n):
+        """
+        Start opening the nth source in the background, returning the source
+        and its future or None if there's nothing to prefetch.
+        """
+        if n >= len(self.sources) or self.sources[n].end <= self.sources[n].start:
+            return None
+
+        return self.sources[n], _prefetch_executor.submit(self._open_source, self.sources[n])
+
     @property
     def at_end(self):
         """
@@ -1,5 +1,4 @@
 import gzip
-from io import BytesIO
 
 import botocore.errorfactory
 import fnmatch
@@ -10,6 +9,9 @@ import urllib.parse
 
 from .aws import s3_client
 
+# matches the uuid spark appends to part file names
+_UUID_RE = re.compile(r'(?:-[0-9a-f]+){6}(?=\.)', re.IGNORECASE)
+
 
 def is_absolute(s3_key):
     """
@@ -68,7 +70,7 @@ def relative_key(key, common_prefix, strip_uuid=True):
         simple_key = simple_key[len(common_prefix):]
 
     if strip_uuid:
-        simple_key = re.sub(r'(?:-[0-9a-f]+){6}(?=\.)', '', simple_key, re.IGNORECASE)
+        simple_key = _UUID_RE.sub('', simple_key)
 
     return simple_key
 
@@ -88,6 +90,10 @@ def list_objects(bucket, prefix, only=None, exclude=None, max_keys=None):
     if max_keys:
         kwargs['MaxKeys'] = max_keys
 
+    # compile the --only and --exclude filters once
+    only_match = only and re.compile(fnmatch.translate(only)).match
+    exclude_match = exclude and re.compile(fnmatch.translate(exclude)).match
+
     # initial call
     resp = s3_client.list_objects_v2(**kwargs)
 
@@ -105,9 +111,9 @@ def list_objects(bucket, prefix, only=None, exclude=None, max_keys=None):
                 continue
 
             # filter by --only and --exclude
-            if only and not fnmatch.fnmatch(file, only):
+            if only_match and not only_match(file):
                 continue
-            if exclude and fnmatch.fnmatch(file, exclude):
+            if exclude_match and exclude_match(file):
                 continue
 
             yield obj
@@ -148,10 +154,20 @@ def read_object(bucket, path, offset=None, length=None):
 
 
 def read_lined_object(bucket, path, offset=None, length=None):
-    raw = read_object(bucket, path, offset, length)
+    """
+    Open an s3 object and return a generator of its lines. Gzipped objects
+    are decompressed as they are streamed instead of being downloaded into
+    memory first.
+    """
+    return read_lines(read_object(bucket, path, offset, length), path)
+
+
+def read_lines(raw, path):
+    """
+    Return a generator of the lines in an already opened s3 object body.
+    """
     if path.endswith('.gz'):
-        bytestream = BytesIO(raw.read())
-        gzip_file = gzip.open(bytestream, 'rt')
+        gzip_file = gzip.open(raw, 'rt', encoding='utf-8')
         return (line.rstrip("\n") for line in gzip_file)  # This is a generator expression, not a tuple.
     else:
         return (line.decode('utf-8').rstrip("\n") for line in raw.iter_lines())
@@ -1,3 +1,5 @@
+import functools
+
 from sqlalchemy import Column, Index, Integer, BigInteger, MetaData, String, Table, text
 from sqlalchemy.exc import OperationalError
 
@@ -96,6 +98,9 @@ class Schema:
         if len(self.key_columns) == 0 and self.locus_class is None:
             raise ValueError(f'Invalid schema (no keys or locus specified)')
 
+        # names of the index columns, in order
+        self.index_column_names = [c.name for c in self.index_columns]
+
         # index building helpers
         self.index_keys = _index_keys(self.key_columns)
         self.index_builder = _index_builder(self.index_keys, self.locus_class, self.locus_columns)
@@ -160,13 +165,14 @@ class Schema:
         Given a tuple yielded by index_keys, convert it into a map of the actual
         column names and values.
         """
-        return {c.name: v for c, v in zip(self.index_columns, index_key)}
+        return dict(zip(self.index_column_names, index_key))
 
-    @property
+    @functools.cached_property
     def sql_filters(self):
         """
         Builds the query string from the index columns that can be used in a
-        SQL execute statement.
+        SQL execute statement. The schema never changes, so this is only
+        built once per schema.
         """
         tests = 'AND'.join(map(lambda k: f'`{k}`=:{k.replace("|", "_")} ', self.key_columns))
 
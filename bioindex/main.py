@@ -1,3 +1,4 @@
+import collections
 import concurrent
 import time
 from enum import Enum
@@ -197,7 +198,10 @@ def convert_cli_arg_to_list(value):
 @click.pass_obj
 def cli_bulk_compression_management(cfg, include, exclude, job_type):
     engine = migrate.migrate(cfg)
-    indexes = index.Index.list_indexes(engine, False)
+    indexes = list(index.Index.list_indexes(engine, False))
+
+    # validate the name/prefix of every index from the one listing
+    prefix_counts = collections.Counter((i.name, i.s3_prefix) for i in indexes)
 
     inclusion_list = convert_cli_arg_to_list(include)
     exclusion_list = convert_cli_arg_to_list(exclude)
@@ -207,8 +211,12 @@ def cli_bulk_compression_management(cfg, include, exclude, job_type):
         for i in indexes:
             if (inclusion_list is None or i.name in inclusion_list) and (
                 exclusion_list is None or i.name not in exclusion_list):
+                if prefix_counts[(i.name, i.s3_prefix)] != 1:
+                    console.print(f'Could not find unique index with name {i.name} and prefix {i.s3_prefix}, skipping')
+                    continue
+
                 futures.append(
-                    executor.submit(check_index_and_launch_job, cfg, i.name, i.s3_prefix, job_type))
+                    executor.submit(start_and_monitor_aws_batch_job, job_type, i.name, i.s3_prefix))
 
         # wait for all futures to complete
         for future in concurrent.futures.as_completed(futures):